@@ -4,9 +4,8 @@ from __future__ import annotations
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ADDRESS, EntityCategory
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -20,8 +19,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: MopekaCoordinator = hass.data[DOMAIN][entry.entry_id]
-    address = entry.data[CONF_ADDRESS]
-    async_add_entities([MopekaDataHealthyBinarySensor(coordinator, address)])
+    async_add_entities([MopekaDataHealthyBinarySensor(coordinator)])
 
 
 class MopekaDataHealthyBinarySensor(CoordinatorEntity[MopekaCoordinator], BinarySensorEntity):
@@ -32,17 +30,10 @@ class MopekaDataHealthyBinarySensor(CoordinatorEntity[MopekaCoordinator], Binary
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator: MopekaCoordinator, address: str) -> None:
+    def __init__(self, coordinator: MopekaCoordinator) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_data_healthy"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"Mopeka {address}",
-            manufacturer="Mopeka",
-            model="Mopeka Pro Series",
-            connections={("bluetooth", address)},
-        )
+        self._attr_unique_id = f"{coordinator.mac_slug}_data_healthy"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
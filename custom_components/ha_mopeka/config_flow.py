@@ -27,6 +27,10 @@ from .const import (
 # Human-readable labels for the tank type dropdown, keyed by TANK_SPECS id.
 _TANK_TYPE_LABELS: dict[str, str] = {k: v.name for k, v in TANK_SPECS.items()}
 
+# Dropdown validators are constant, so build them once and share across forms.
+_MEDIUM_TYPE_VALIDATOR = vol.In([item.value for item in MediumType])
+_TANK_TYPE_VALIDATOR = vol.In(_TANK_TYPE_LABELS)
+
 # Default custom height (mm) shown as placeholder when a custom type is chosen.
 _DEFAULT_CUSTOM_HEIGHT_MM = 300
 _MM_PER_INCH = 25.4
@@ -42,12 +46,10 @@ def _core_schema(defaults: dict[str, Any], address_field: vol.Marker | None = No
     fields: dict[vol.Marker, Any] = {}
     if address_field is not None:
         fields[address_field] = str
-    fields[vol.Required(CONF_MEDIUM_TYPE, default=defaults.get(CONF_MEDIUM_TYPE, MediumType.PROPANE.value))] = vol.In(
-        [item.value for item in MediumType]
-    )
-    fields[vol.Required(CONF_TANK_TYPE, default=defaults.get(CONF_TANK_TYPE, "20lb_v"))] = vol.In(
-        _TANK_TYPE_LABELS
+    fields[vol.Required(CONF_MEDIUM_TYPE, default=defaults.get(CONF_MEDIUM_TYPE, MediumType.PROPANE.value))] = (
+        _MEDIUM_TYPE_VALIDATOR
     )
+    fields[vol.Required(CONF_TANK_TYPE, default=defaults.get(CONF_TANK_TYPE, "20lb_v"))] = _TANK_TYPE_VALIDATOR
     return vol.Schema(fields)
 
 
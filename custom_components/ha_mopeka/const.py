@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import cached_property, lru_cache
+import math
 
 DOMAIN = "ha_mopeka"
 
@@ -97,6 +100,27 @@ class TankSpec:
     height_mm: float
     min_offset_mm: float = PROPANE_MIN_OFFSET_MM
 
+    @cached_property
+    def percentage_lut(self) -> array:
+        """Depth (whole mm) -> fill percentage table, built on first use.
+
+        Every formula saturates once depth reaches height_mm, so the table only
+        needs to span 0..ceil(height_mm); deeper readings reuse the last entry.
+        """
+        if self.shape is TankShape.VERTICAL_CYLINDER:
+            return _vertical_cylinder_lut(self.height_mm, self.min_offset_mm)
+        if self.shape is TankShape.HORIZONTAL_CYLINDER:
+            return _horizontal_cylinder_lut(self.height_mm)
+        return _rectangular_lut(self.height_mm)
+
+    def percentage(self, depth_mm: float) -> float:
+        """Return fill percentage for a depth, at whole-millimetre resolution."""
+        lut = self.percentage_lut
+        index = int(depth_mm)
+        if index <= 0:
+            return lut[0]
+        return lut[index] if index < len(lut) else lut[-1]
+
 
 TANK_SPECS: dict[str, TankSpec] = {
     # ── North America: vertical propane ──────────────────────────────────────
@@ -142,66 +166,69 @@ COMPENSATION_COEFFICIENTS: dict[MediumType, tuple[float, float, float]] = {
 }
 
 
-def apply_temperature_compensation(distance_raw_mm: int, temp_raw: int, medium_type: MediumType) -> int:
-    """Apply medium-specific temperature compensation to distance."""
-    c0, c1, c2 = COMPENSATION_COEFFICIENTS[medium_type]
-    factor = c0 + (c1 * temp_raw) + (c2 * temp_raw * temp_raw)
-    return int(distance_raw_mm * factor)
+# Compensation factor per medium for every 7-bit raw temperature (0..127),
+# precomputed from COMPENSATION_COEFFICIENTS.
+COMPENSATION_FACTORS: dict[MediumType, tuple[float, ...]] = {
+    medium: tuple(c0 + (c1 * temp_raw) + (c2 * temp_raw * temp_raw) for temp_raw in range(128))
+    for medium, (c0, c1, c2) in COMPENSATION_COEFFICIENTS.items()
+}
 
 
-def calculate_tank_percentage(
-    tank_type: str,
-    measured_depth_mm: float,
-    custom_height_mm: float | None = None,
-) -> float:
-    """Calculate tank fill percentage.
+@lru_cache(maxsize=32)
+def resolve_tank_spec(tank_type: str, custom_height_mm: float | None = None) -> TankSpec:
+    """Return the TankSpec used for percentage calculation.
 
     For custom tank types, custom_height_mm overrides the placeholder height
-    stored in TANK_SPECS.
+    stored in TANK_SPECS. Results are cached so each resolved spec (and its
+    lookup table) is built once and shared.
     """
     spec = TANK_SPECS.get(tank_type, TANK_SPECS["20lb_v"])
-    height_mm = (
-        custom_height_mm
-        if (tank_type in CUSTOM_TANK_KEYS and custom_height_mm is not None and custom_height_mm > 0)
-        else spec.height_mm
-    )
-    if spec.shape is TankShape.VERTICAL_CYLINDER:
-        return _calculate_vertical_cylinder(measured_depth_mm, height_mm, spec.min_offset_mm)
-    if spec.shape is TankShape.HORIZONTAL_CYLINDER:
-        return _calculate_horizontal_cylinder(measured_depth_mm, height_mm)
-    return _calculate_rectangular(measured_depth_mm, height_mm)
+    if tank_type in CUSTOM_TANK_KEYS and custom_height_mm is not None and custom_height_mm > 0:
+        return replace(spec, height_mm=custom_height_mm)
+    return spec
 
 
-def _calculate_vertical_cylinder(fill_depth_mm: float, height_mm: float, min_offset_mm: float) -> float:
+def _vertical_cylinder_lut(height_mm: float, min_offset_mm: float) -> array:
     """Mopeka linear formula for vertical cylindrical tanks.
 
     Matches the official Mopeka app's getPercentFromHeight for vertical tanks.
-    fill_depth_mm below min_offset_mm is treated as 0% (sensor dead zone).
+    Depths below min_offset_mm are treated as 0% (sensor dead zone).
     """
     if height_mm <= min_offset_mm:
-        return 100.0  # degenerate / unconfigured spec
-    pct = 100.0 * (fill_depth_mm - min_offset_mm) / (height_mm - min_offset_mm)
-    return max(0.0, min(100.0, pct))
+        return array("d", (100.0,))  # degenerate / unconfigured spec
+    scale = 100.0 / (height_mm - min_offset_mm)
+    return array(
+        "d",
+        [min(100.0, max(0.0, (depth - min_offset_mm) * scale)) for depth in range(math.ceil(height_mm) + 1)],
+    )
+
+
+# Horizontal-cylinder fill polynomial coefficients, pre-scaled to percent.
+_HORIZ_C3 = 100.0 * -1.16533
+_HORIZ_C2 = 100.0 * 1.7615
+_HORIZ_C1 = 100.0 * 0.40923
 
 
-def _calculate_horizontal_cylinder(fill_depth_mm: float, diameter_mm: float) -> float:
+def _horizontal_cylinder_lut(diameter_mm: float) -> array:
     """Circular-segment fill percentage for horizontal cylindrical tanks.
 
     Uses the cubic-polynomial approximation from the official Mopeka app:
         f(t) = -1.16533*t³ + 1.7615*t² + 0.40923*t
     where t = fill_depth / diameter. Accurate to <0.5% vs the exact integral.
+    Evaluated in Horner form with the 100x percentage scale folded into the
+    coefficients. Depth 0 is 0% and depths at or beyond the diameter are 100%.
     """
-    if fill_depth_mm <= 0.0:
-        return 0.0
-    if fill_depth_mm >= diameter_mm:
-        return 100.0
-    t = fill_depth_mm / diameter_mm
-    pct = 100.0 * (-1.16533 * t * t * t + 1.7615 * t * t + 0.40923 * t)
-    return max(0.0, min(100.0, pct))
+    inv_diameter = 1.0 / diameter_mm
+    partial = [
+        min(100.0, max(0.0, ((_HORIZ_C3 * t + _HORIZ_C2) * t + _HORIZ_C1) * t))
+        for t in [depth * inv_diameter for depth in range(1, math.ceil(diameter_mm))]
+    ]
+    return array("d", [0.0, *partial, 100.0])
 
 
-def _calculate_rectangular(fill_depth_mm: float, height_mm: float) -> float:
+def _rectangular_lut(height_mm: float) -> array:
     """Linear fill percentage for rectangular tanks (water, liquid)."""
     if height_mm <= 0.0:
-        return 0.0
-    return max(0.0, min(100.0, 100.0 * fill_depth_mm / height_mm))
+        return array("d", (0.0,))
+    scale = 100.0 / height_mm
+    return array("d", [min(100.0, depth * scale) for depth in range(math.ceil(height_mm) + 1)])
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from dataclasses import replace
+from datetime import datetime
+from functools import cached_property
 import logging
 import time
 
@@ -15,16 +17,20 @@ from homeassistant.components.bluetooth import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     CONF_CUSTOM_TANK_HEIGHT_MM,
     CONF_MEDIUM_TYPE,
     CONF_TANK_TYPE,
+    COMPENSATION_FACTORS,
     DATA_HEALTH_TIMEOUT_SECONDS,
     DOMAIN,
     MediumType,
     OFFLINE_TIMEOUT_SECONDS,
+    resolve_tank_spec,
 )
 from .model import MopekaSensorData
 from .parser import extract_mopeka_manufacturer_payload, parse_mopeka_data
@@ -40,16 +46,39 @@ class MopekaCoordinator(DataUpdateCoordinator[MopekaSensorData | None]):
             hass,
             _LOGGER,
             name=f"Mopeka {entry.data[CONF_ADDRESS]}",
-            update_interval=timedelta(seconds=60),
+            update_interval=None,
         )
         self.entry = entry
         self.address: str = entry.data[CONF_ADDRESS]
+        # Normalized MAC used as the unique_id prefix for every entity.
+        self.mac_slug: str = self.address.replace(":", "").lower()
         self.medium_type = MediumType(entry.options.get(CONF_MEDIUM_TYPE, entry.data.get(CONF_MEDIUM_TYPE, MediumType.PROPANE.value)))
         self.tank_type: str = entry.options.get(CONF_TANK_TYPE, entry.data.get(CONF_TANK_TYPE, "20lb_v"))
         raw_custom = entry.options.get(CONF_CUSTOM_TANK_HEIGHT_MM, entry.data.get(CONF_CUSTOM_TANK_HEIGHT_MM))
         self.custom_tank_height_mm: float | None = float(raw_custom) if raw_custom is not None else None
+        # Options are read once above, so resolve the medium's factor row and
+        # tank spec once too instead of per advertisement.
+        self._compensation_factors = COMPENSATION_FACTORS[self.medium_type]
+        self._tank_spec = resolve_tank_spec(self.tank_type, self.custom_tank_height_mm)
         self._last_seen_monotonic: float | None = None
+        # Monotonic deadlines derived from the last advertisement, so the
+        # health properties are a single compare.
+        self._healthy_until: float = 0.0
+        self._available_until: float = 0.0
+        # Raw payload of the last successfully parsed advertisement. Beacons
+        # repeat identical payloads; those only refresh the last-seen time.
+        self._last_payload: bytes | None = None
+        # Entity-visible raw fields of the last reading pushed to entities;
+        # readings that repeat them are not re-published.
+        self._last_significant: tuple[int, int, int, int, int, int] | None = None
         self._unsub_ble: callable | None = None
+        # One-shot timer armed for the next health/availability deadline, and
+        # the monotonic time it fires at.
+        self._unsub_health: callable | None = None
+        self._health_timer_at: float = 0.0
+        # (data_healthy, available) as last seen by entities; the health timer
+        # only notifies listeners when this flips.
+        self._last_health: tuple[bool, bool] = (False, False)
         # Bounce gate: once quality drops to 0 we stay locked (reporting 0%)
         # until quality recovers to >= 2, preventing brief quality=1 blips
         # from prematurely restoring a false non-zero level reading.
@@ -83,24 +112,34 @@ class MopekaCoordinator(DataUpdateCoordinator[MopekaSensorData | None]):
 
     async def async_stop(self) -> None:
         """Stop BLE callback subscription."""
+        if self._unsub_health is not None:
+            self._unsub_health()
+            self._unsub_health = None
         if self._unsub_ble is not None:
             self._unsub_ble()
             self._unsub_ble = None
             _LOGGER.info("Stopped passive BLE listener for Mopeka %s", self.address)
 
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Device registry info shared by all entities of this sensor."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.address)},
+            name=f"Mopeka {self.address}",
+            manufacturer="Mopeka",
+            model="Mopeka Pro Series",
+            connections={("bluetooth", self.address)},
+        )
+
     @property
     def data_healthy(self) -> bool:
         """Return true when data has been received recently."""
-        if self._last_seen_monotonic is None:
-            return False
-        return (time.monotonic() - self._last_seen_monotonic) < DATA_HEALTH_TIMEOUT_SECONDS
+        return time.monotonic() < self._healthy_until
 
     @property
     def available(self) -> bool:
         """Return true while the sensor is not stale/offline."""
-        if self._last_seen_monotonic is None:
-            return False
-        return (time.monotonic() - self._last_seen_monotonic) < OFFLINE_TIMEOUT_SECONDS
+        return time.monotonic() < self._available_until
 
     @property
     def last_seen_age(self) -> float | None:
@@ -109,10 +148,56 @@ class MopekaCoordinator(DataUpdateCoordinator[MopekaSensorData | None]):
             return None
         return time.monotonic() - self._last_seen_monotonic
 
+    def _mark_seen(self) -> None:
+        """Record an advertisement and push out the health deadlines."""
+        now = time.monotonic()
+        self._last_seen_monotonic = now
+        self._healthy_until = now + DATA_HEALTH_TIMEOUT_SECONDS
+        self._available_until = now + OFFLINE_TIMEOUT_SECONDS
+        # A pending timer re-arms itself for the extended deadline when it fires,
+        # so it only needs rescheduling when it is due after the new health
+        # deadline (e.g. it was waiting for the offline deadline).
+        if self._unsub_health is None or self._health_timer_at > self._healthy_until:
+            self._schedule_health_timer(now)
+
+    def _schedule_health_timer(self, now: float) -> None:
+        """Arm a one-shot timer for the next deadline that has not passed yet.
+
+        Updates are pushed from BLE callbacks; the timer only exists so
+        entities notice exactly when the sensor goes quiet or offline.
+        """
+        if self._unsub_health is not None:
+            self._unsub_health()
+            self._unsub_health = None
+        deadlines = [deadline for deadline in (self._healthy_until, self._available_until) if deadline > now]
+        if deadlines:
+            self._health_timer_at = min(deadlines)
+            self._unsub_health = async_call_later(self.hass, self._health_timer_at - now, self._async_health_timer)
+
+    @callback
+    def _async_health_timer(self, _now: datetime) -> None:
+        """Publish health transitions at a deadline and arm the next one."""
+        self._unsub_health = None
+        self._async_check_health()
+        self._schedule_health_timer(time.monotonic())
+
+    @callback
+    def _async_check_health(self) -> None:
+        """Notify listeners when health/availability changed without new data."""
+        now = time.monotonic()
+        health = (now < self._healthy_until, now < self._available_until)
+        if health != self._last_health:
+            self._last_health = health
+            self.async_update_listeners()
+
     def _handle_service_info(self, service_info: BluetoothServiceInfoBleak) -> None:
         payload = extract_mopeka_manufacturer_payload(service_info.manufacturer_data)
         if payload is None:
             return
+        if payload == self._last_payload:
+            self._mark_seen()
+            self._async_check_health()
+            return
         _LOGGER.debug(
             "BLE adv received for %s: rssi=%s mfg_len=%s",
             service_info.address,
@@ -124,11 +209,13 @@ class MopekaCoordinator(DataUpdateCoordinator[MopekaSensorData | None]):
             manufacturer_data=payload,
             medium_type=self.medium_type,
             tank_type=self.tank_type,
-            custom_height_mm=self.custom_tank_height_mm,
+            tank_spec=self._tank_spec,
+            compensation_factors=self._compensation_factors,
         )
         if parsed is None:
             _LOGGER.debug("Failed to parse Mopeka manufacturer payload for %s", service_info.address)
             return
+        self._last_payload = payload
         # Bounce gate: lock on quality=0, only release at quality>=2.
         # This prevents a brief quality=1 blip from restoring a false reading.
         if parsed.quality_raw == 0:
@@ -154,8 +241,21 @@ class MopekaCoordinator(DataUpdateCoordinator[MopekaSensorData | None]):
                     service_info.address,
                 )
         if self._quality_locked:
-            parsed.tank_level_percent = 0.0
-        self._last_seen_monotonic = time.monotonic()
+            parsed = replace(parsed, tank_level_percent=0.0)
+        self._mark_seen()
+        significant = (
+            parsed.distance_raw_mm,
+            parsed.quality_raw,
+            parsed.battery_percent,
+            parsed.temperature_c,
+            parsed.accelerometer_x,
+            parsed.accelerometer_y,
+        )
+        if significant == self._last_significant:
+            self._async_check_health()
+            return
+        self._last_significant = significant
+        self._last_health = (True, True)  # just seen: healthy and available
         _LOGGER.debug(
             "Parsed Mopeka %s: tank=%0.1f%% temp=%sC batt=%s%% quality=%s%% model=%s",
             service_info.address,
@@ -168,5 +268,5 @@ class MopekaCoordinator(DataUpdateCoordinator[MopekaSensorData | None]):
         self.async_set_updated_data(parsed)
 
     async def _async_update_data(self) -> MopekaSensorData | None:
-        """Periodic refresh for stale availability and listeners."""
+        """Manual refresh (e.g. homeassistant.update_entity) re-publishes current data."""
         return self.data
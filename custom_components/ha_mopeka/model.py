@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import time
 
 from .const import MediumType
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class MopekaSensorData:
     """Parsed data from a Mopeka advertisement."""
 
@@ -26,8 +25,4 @@ class MopekaSensorData:
     tank_level_percent: float
     medium_type: MediumType
     tank_type: str
-    timestamp: float = 0.0
-
-    def __post_init__(self) -> None:
-        if self.timestamp == 0.0:
-            self.timestamp = time.time()
+    timestamp: float
@@ -2,71 +2,139 @@
 
 from __future__ import annotations
 
+import struct
+import sys
+import time
+
 from .const import (
     MANUFACTURER_ID,
     MediumType,
     SYNC_BYTE_TO_MODEL,
-    apply_temperature_compensation,
-    calculate_tank_percentage,
+    TankSpec,
 )
 from .model import MopekaSensorData
 
 MIN_MANUFACTURER_PAYLOAD = 10
 
+# sync, battery, temperature, distance|quality (LE 16-bit), 3 unused bytes,
+# accelerometer x, accelerometer y.
+_PAYLOAD_STRUCT = struct.Struct("<BBBHxxxBB")
+
+# Battery percent for every raw battery byte (voltage = raw / 32, 2.2 V..2.85 V
+# mapped to 0..100%), and quality percent for the 2-bit quality field.
+_BATTERY_PERCENT = bytes(max(0, min(100, round(((raw / 32.0 - 2.2) / 0.65) * 100.0))) for raw in range(256))
+_QUALITY_PERCENT = tuple(round((quality / 3.0) * 100.0) for quality in range(4))
+
+# Model name for every possible sync byte (None for unknown models), so the
+# hot path is a single index instead of a membership test plus dict lookup.
+# Names are interned so every reading shares the same string objects.
+_MODEL_NAMES: tuple[str | None, ...] = tuple(
+    sys.intern(name) if (name := SYNC_BYTE_TO_MODEL.get(sync_byte)) is not None else None
+    for sync_byte in range(256)
+)
+
 
 def parse_mopeka_data(
     address: str,
     manufacturer_data: bytes,
     medium_type: MediumType,
     tank_type: str,
-    custom_height_mm: float | None = None,
+    tank_spec: TankSpec,
+    compensation_factors: tuple[float, ...],
 ) -> MopekaSensorData | None:
-    """Parse Mopeka manufacturer payload into structured data."""
+    """Parse Mopeka manufacturer payload into structured data.
+
+    tank_spec (from resolve_tank_spec) and compensation_factors (the
+    COMPENSATION_FACTORS row for medium_type) are resolved once by the
+    caller, so no per-packet config lookups happen here. medium_type and
+    tank_type are only recorded on the result.
+    """
     if len(manufacturer_data) < MIN_MANUFACTURER_PAYLOAD:
         return None
+    return _decode_record(
+        address,
+        _PAYLOAD_STRUCT.unpack_from(manufacturer_data),
+        medium_type,
+        tank_type,
+        tank_spec,
+        compensation_factors,
+        time.time(),
+    )
 
-    sync_byte = manufacturer_data[0]
-    if sync_byte not in SYNC_BYTE_TO_MODEL:
-        return None
 
-    battery_raw = manufacturer_data[1]
-    temp_raw = manufacturer_data[2] & 0x7F
-    temp_c = temp_raw - 40
+def parse_mopeka_batch(
+    address: str,
+    records: bytes,
+    medium_type: MediumType,
+    tank_type: str,
+    tank_spec: TankSpec,
+    compensation_factors: tuple[float, ...],
+) -> list[MopekaSensorData]:
+    """Parse a buffer of back-to-back 10-byte Mopeka payloads (e.g. a BLE log).
 
-    low = manufacturer_data[3]
-    high = manufacturer_data[4]
-    distance_raw_mm = ((high << 8) | low) & 0x3FFF
-    quality_raw = (high >> 6) & 0x03
-    quality_percent = round((quality_raw / 3.0) * 100.0)
+    Takes the same resolved tank/medium inputs as parse_mopeka_data and
+    decodes records with struct.iter_unpack. Records with an unknown sync byte
+    are skipped. The coordinator's quality bounce gate is not applied.
+    """
+    if len(records) % _PAYLOAD_STRUCT.size:
+        raise ValueError(f"Record buffer length {len(records)} is not a multiple of {_PAYLOAD_STRUCT.size}")
 
-    accel_x = manufacturer_data[8]
-    accel_y = manufacturer_data[9]
+    timestamp = time.time()
+    results: list[MopekaSensorData] = []
+    for fields in _PAYLOAD_STRUCT.iter_unpack(records):
+        parsed = _decode_record(address, fields, medium_type, tank_type, tank_spec, compensation_factors, timestamp)
+        if parsed is not None:
+            results.append(parsed)
+    return results
 
-    battery_voltage = battery_raw / 32.0
-    battery_percent = round(((battery_voltage - 2.2) / 0.65) * 100.0)
-    battery_percent = max(0, min(100, battery_percent))
 
-    compensated_mm = apply_temperature_compensation(distance_raw_mm, temp_raw, medium_type)
-    tank_percent = calculate_tank_percentage(tank_type, float(compensated_mm), custom_height_mm)
+def _decode_record(
+    address: str,
+    fields: tuple[int, int, int, int, int, int],
+    medium_type: MediumType,
+    tank_type: str,
+    tank_spec: TankSpec,
+    compensation_factors: tuple[float, ...],
+    timestamp: float,
+) -> MopekaSensorData | None:
+    """Build MopekaSensorData from one unpacked payload record."""
+    sync_byte, battery_raw, temp_byte, distance_quality, accel_x, accel_y = fields
+    model_name = _MODEL_NAMES[sync_byte]
+    if model_name is None:
+        return None
+
+    temp_raw = temp_byte & 0x7F
+    distance_raw_mm = distance_quality & 0x3FFF
+    quality_raw = distance_quality >> 14
+    compensated_mm = int(distance_raw_mm * compensation_factors[temp_raw])
 
     return MopekaSensorData(
         mac_address=address,
         model_id=sync_byte,
-        model_name=SYNC_BYTE_TO_MODEL[sync_byte],
-        battery_percent=battery_percent,
+        model_name=model_name,
+        battery_percent=_BATTERY_PERCENT[battery_raw],
         distance_raw_mm=distance_raw_mm,
         compensated_distance_mm=compensated_mm,
-        temperature_c=temp_c,
-        quality_percent=quality_percent,
+        temperature_c=temp_raw - 40,
+        quality_percent=_QUALITY_PERCENT[quality_raw],
         quality_raw=quality_raw,
         accelerometer_x=accel_x,
         accelerometer_y=accel_y,
-        tank_level_percent=tank_percent,
+        tank_level_percent=tank_spec.percentage(compensated_mm),
         medium_type=medium_type,
         tank_type=tank_type,
+        timestamp=timestamp,
     )
 
 
 def extract_mopeka_manufacturer_payload(manufacturer_data_map: dict[int, bytes]) -> bytes | None:
-    """Extract Mopeka payload from HA bluetooth manufacturer_data map."""
-    return manufacturer_data_map.get(MANUFACTURER_ID)
+    """Extract Mopeka payload from HA bluetooth manufacturer_data map.
+
+    Returns None unless the payload is long enough and carries a known model
+    sync byte, so foreign beacons sharing the manufacturer id are dropped
+    before parsing.
+    """
+    payload = manufacturer_data_map.get(MANUFACTURER_ID)
+    if payload is None or len(payload) < MIN_MANUFACTURER_PAYLOAD or _MODEL_NAMES[payload[0]] is None:
+        return None
+    return payload
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,9 +13,8 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ADDRESS, EntityCategory, UnitOfLength, UnitOfTemperature
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import EntityCategory, UnitOfLength, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -22,111 +22,121 @@ from .const import DOMAIN
 from .coordinator import MopekaCoordinator
 from .model import MopekaSensorData
 
+_MM_TO_IN = 1.0 / 25.4
+_TANK_LEVEL_KEY = "tank_level"
+
 
 @dataclass(frozen=True, kw_only=True)
 class MopekaSensorDescription(SensorEntityDescription):
     value_fn: Callable[[MopekaSensorData], float | int | str | None]
 
 
-SENSOR_DESCRIPTIONS: tuple[MopekaSensorDescription, ...] = (
-    MopekaSensorDescription(
-        key="tank_level",
-        name="Tank Level",
-        native_unit_of_measurement="%",
-        icon="mdi:propane-tank",
-        state_class=SensorStateClass.MEASUREMENT,
-        suggested_display_precision=1,
-        value_fn=lambda d: round(d.tank_level_percent, 1),
-    ),
-    MopekaSensorDescription(
-        key="temperature",
-        name="Temperature",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda d: d.temperature_c,
-    ),
-    MopekaSensorDescription(
-        key="battery",
-        name="Battery",
-        native_unit_of_measurement="%",
-        device_class=SensorDeviceClass.BATTERY,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.battery_percent,
-    ),
-    MopekaSensorDescription(
-        key="read_quality",
-        name="Read Quality",
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        icon="mdi:signal",
-        value_fn=lambda d: d.quality_raw,
-    ),
-    MopekaSensorDescription(
-        key="quality_percent",
-        name="Read Quality Percent",
-        native_unit_of_measurement="%",
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        icon="mdi:signal",
-        value_fn=lambda d: d.quality_percent,
-    ),
-    MopekaSensorDescription(
-        key="distance_raw_mm",
-        name="Distance Raw",
-        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.distance_raw_mm,
-    ),
-    MopekaSensorDescription(
-        key="distance_compensated_mm",
-        name="Distance Compensated",
-        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.compensated_distance_mm,
-    ),
-    MopekaSensorDescription(
-        key="accelerometer_x",
-        name="Accelerometer X",
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.accelerometer_x,
-    ),
-    MopekaSensorDescription(
-        key="accelerometer_y",
-        name="Accelerometer Y",
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.accelerometer_y,
-    ),
-    MopekaSensorDescription(
-        key="model_name",
-        name="Model",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.model_name,
-    ),
-    MopekaSensorDescription(
-        key="model_id",
-        name="Model ID",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.model_id,
-    ),
-    MopekaSensorDescription(
-        key="medium_type",
-        name="Medium Type",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.medium_type.value,
-    ),
-    MopekaSensorDescription(
-        key="tank_type",
-        name="Tank Type",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda d: d.tank_type,
-    ),
-)
+def _tank_level_value(data: MopekaSensorData) -> float:
+    return round(data.tank_level_percent, 1)
+
+
+SENSOR_DESCRIPTIONS: dict[str, MopekaSensorDescription] = {
+    desc.key: desc
+    for desc in (
+        MopekaSensorDescription(
+            key=_TANK_LEVEL_KEY,
+            name="Tank Level",
+            native_unit_of_measurement="%",
+            icon="mdi:propane-tank",
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
+            value_fn=_tank_level_value,
+        ),
+        MopekaSensorDescription(
+            key="temperature",
+            name="Temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=attrgetter("temperature_c"),
+        ),
+        MopekaSensorDescription(
+            key="battery",
+            name="Battery",
+            native_unit_of_measurement="%",
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("battery_percent"),
+        ),
+        MopekaSensorDescription(
+            key="read_quality",
+            name="Read Quality",
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            icon="mdi:signal",
+            value_fn=attrgetter("quality_raw"),
+        ),
+        MopekaSensorDescription(
+            key="quality_percent",
+            name="Read Quality Percent",
+            native_unit_of_measurement="%",
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            icon="mdi:signal",
+            value_fn=attrgetter("quality_percent"),
+        ),
+        MopekaSensorDescription(
+            key="distance_raw_mm",
+            name="Distance Raw",
+            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("distance_raw_mm"),
+        ),
+        MopekaSensorDescription(
+            key="distance_compensated_mm",
+            name="Distance Compensated",
+            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("compensated_distance_mm"),
+        ),
+        MopekaSensorDescription(
+            key="accelerometer_x",
+            name="Accelerometer X",
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("accelerometer_x"),
+        ),
+        MopekaSensorDescription(
+            key="accelerometer_y",
+            name="Accelerometer Y",
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("accelerometer_y"),
+        ),
+        MopekaSensorDescription(
+            key="model_name",
+            name="Model",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("model_name"),
+        ),
+        MopekaSensorDescription(
+            key="model_id",
+            name="Model ID",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("model_id"),
+        ),
+        MopekaSensorDescription(
+            key="medium_type",
+            name="Medium Type",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("medium_type.value"),
+        ),
+        MopekaSensorDescription(
+            key="tank_type",
+            name="Tank Type",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=attrgetter("tank_type"),
+        ),
+    )
+}
 
 
 async def async_setup_entry(
@@ -135,60 +145,70 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: MopekaCoordinator = hass.data[DOMAIN][entry.entry_id]
-    address = entry.data[CONF_ADDRESS]
-    async_add_entities(MopekaSensor(coordinator, address, desc) for desc in SENSOR_DESCRIPTIONS)
+    async_add_entities([MopekaSensor(coordinator, desc) for desc in SENSOR_DESCRIPTIONS.values()])
 
 
 class MopekaSensor(CoordinatorEntity[MopekaCoordinator], SensorEntity):
     """Mopeka sensor entity."""
 
+    # Only this class's own fields can be slotted: HA's Entity base keeps a
+    # __dict__ and its metaclass manages the _attr_* attributes.
+    __slots__ = ("_value_fn", "_is_tank_level")
+
     entity_description: MopekaSensorDescription
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: MopekaCoordinator,
-        address: str,
         description: MopekaSensorDescription,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=f"Mopeka {address}",
-            manufacturer="Mopeka",
-            model="Mopeka Pro Series",
-            connections={("bluetooth", address)},
-        )
+        self._value_fn = description.value_fn
+        # Only the tank level sensor carries extra attributes.
+        self._is_tank_level = description.key == _TANK_LEVEL_KEY
+        self._attr_unique_id = f"{coordinator.mac_slug}_{description.key}"
+        self._attr_device_info = coordinator.device_info
+        self._update_from_data()
 
     @property
     def available(self) -> bool:
-        return self.coordinator.available and self.coordinator.data is not None
-
-    @property
-    def native_value(self):
-        if self.coordinator.data is None:
-            return None
-        return self.entity_description.value_fn(self.coordinator.data)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, float | int | str] | None:
-        if self.coordinator.data is None:
-            return None
-        if self.entity_description.key != "tank_level":
-            return None
+        # CoordinatorEntity.available would report last_update_success, so
+        # return the value cached by _update_from_data instead.
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute state once per coordinator update, then write it."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Cache availability, native value and attributes for the current data.
+
+        HA reads these on every state write; computing them here means each
+        coordinator update costs one value_fn call and at most one attribute
+        dict, however often the state is read.
+        """
         data = self.coordinator.data
-        inches = data.compensated_distance_mm / 25.4
+        self._attr_available = self.coordinator.available and data is not None
+        if data is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+        self._attr_native_value = self._value_fn(data)
+        if not self._is_tank_level:
+            return
         if data.quality_raw == 0:
             status = "Empty or signal lost"
         elif self.coordinator._quality_locked:
             status = "Recovering (signal unstable)"
         else:
             status = "OK"
-        return {
+        self._attr_extra_state_attributes = {
             "distance_mm": data.compensated_distance_mm,
-            "distance_in": round(inches, 1),
+            # Distance is never negative, so half-up to 0.1 in via int() is safe.
+            "distance_in": int(data.compensated_distance_mm * _MM_TO_IN * 10 + 0.5) / 10,
             "level_status": status,
         }